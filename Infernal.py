@@ -6,10 +6,18 @@ Description: A 2D action game built with pygame. The game features a player, ene
 """
 
 import pygame
+import numpy as np
 import random
 import math
 import sys
-from typing import List
+import functools
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the NumPy versions of the hot loops are used
+    njit = None
+
 
 # -------------------------
 # Global Constants
@@ -50,6 +58,201 @@ class Constants:
     ENEMY_SPAWN_MARGIN = 2
 
 
+# -------------------------
+# Helper Functions
+# -------------------------
+@functools.lru_cache(maxsize=128)
+def get_font(size: int) -> pygame.font.Font:
+    """Return the default font at the given size, created only once per size."""
+    return pygame.font.Font(None, size)
+
+
+@functools.lru_cache(maxsize=64)
+def load_image(path: str) -> pygame.Surface:
+    """
+    Load an image with per-pixel alpha. Each file is read and decoded only once,
+    so the returned surface is shared and must not be modified.
+    """
+    return pygame.image.load(path).convert_alpha()
+
+
+@functools.lru_cache(maxsize=64)
+def load_scaled(path: str, width: int, height: int) -> pygame.Surface:
+    """Return the image scaled to the given size, built once per (path, size)."""
+    return pygame.transform.scale(load_image(path), (width, height))
+
+
+@functools.lru_cache(maxsize=64)
+def load_rotozoomed(path: str, scale: float) -> pygame.Surface:
+    """Return the image smoothly scaled by the given factor, built once per (path, scale)."""
+    return pygame.transform.rotozoom(load_image(path), 0, scale)
+
+
+def fast_norm(dx: float, dy: float) -> Tuple[float, float]:
+    """
+    Return the vector (dx, dy) scaled to unit length, or (0, 0) for a zero vector.
+    Uses a single reciprocal square root instead of math.hypot and two divisions.
+    """
+    length_sq: float = dx * dx + dy * dy
+    if length_sq == 0:
+        return 0.0, 0.0
+    if length_sq == 1:
+        return dx, dy
+    inv_length: float = length_sq**-0.5
+    return dx * inv_length, dy * inv_length
+
+
+def build_move_table(diagonal_factor: float) -> Tuple[Tuple[float, float], ...]:
+    """
+    Return the (dx, dy) movement direction for every key state mask
+    (left | right << 1 | up << 2 | down << 3). Opposite keys cancel out
+    and diagonal directions are scaled by the given factor.
+    """
+    table: List[Tuple[float, float]] = []
+    for mask in range(16):
+        direction_x: int = (mask >> 1 & 1) - (mask & 1)
+        direction_y: int = (mask >> 3 & 1) - (mask >> 2 & 1)
+        factor: float = diagonal_factor if direction_x and direction_y else 1
+        table.append((direction_x * factor, direction_y * factor))
+    return tuple(table)
+
+
+def overlapping(rect: pygame.Rect, boxes: List[List[int]]) -> List[List[int]]:
+    """Return the (x1, y1, x2, y2) boxes that overlap the rectangle."""
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    return [
+        box
+        for box in boxes
+        if left < box[2] and right > box[0] and top < box[3] and bottom > box[1]
+    ]
+
+
+# -------------------------
+# Hot Loop Kernels
+# -------------------------
+# The per-frame bullet and enemy loops are compiled with Numba when it is installed.
+# Otherwise the same operations run as vectorized NumPy code.
+if njit is not None:
+
+    @njit(cache=True)
+    def move_bullets(x, y, dx, dy, lifetime, alive) -> None:
+        """Move the active bullets by their velocity and reduce their lifetime."""
+        for i in range(x.size):
+            if alive[i]:
+                x[i] += dx[i]
+                y[i] += dy[i]
+                lifetime[i] -= 1
+
+    @njit(cache=True)
+    def cull_bullets(x, y, lifetime, alive, width, height, game_width, game_height):
+        """Deactivate bullets that are off-screen or whose lifetime has expired."""
+        for i in range(x.size):
+            if alive[i]:
+                alive[i] = (
+                    lifetime[i] > 0
+                    and x[i] + width >= 0
+                    and x[i] <= game_width
+                    and y[i] + height >= 0
+                    and y[i] <= game_height
+                )
+
+    @njit(cache=True)
+    def move_enemies(pos, size, vel, alive, wall_rects) -> None:
+        """
+        Move the active enemies first horizontally, then vertically. An enemy that ends
+        up inside a wall is pushed back along that axis and reverses that direction.
+        """
+        for i in range(pos.shape[0]):
+            if not alive[i]:
+                continue
+            for axis in range(2):
+                pos[i, axis] += vel[i, axis]
+                wall_near = np.inf
+                wall_far = -np.inf
+                for j in range(wall_rects.shape[0]):
+                    if (
+                        pos[i, 0] < wall_rects[j, 2]
+                        and pos[i, 0] + size[i, 0] > wall_rects[j, 0]
+                        and pos[i, 1] < wall_rects[j, 3]
+                        and pos[i, 1] + size[i, 1] > wall_rects[j, 1]
+                    ):
+                        wall_near = min(wall_near, wall_rects[j, axis])
+                        wall_far = max(wall_far, wall_rects[j, axis + 2])
+                if wall_far == -np.inf:
+                    continue
+                if vel[i, axis] > 0:
+                    pos[i, axis] = wall_near - size[i, axis]
+                elif vel[i, axis] < 0:
+                    pos[i, axis] = wall_far
+                vel[i, axis] = -vel[i, axis]  # Reverse direction upon collision
+
+else:
+
+    def move_bullets(x, y, dx, dy, lifetime, alive) -> None:
+        """Move the active bullets by their velocity and reduce their lifetime."""
+        np.add(x, dx, out=x, where=alive)
+        np.add(y, dy, out=y, where=alive)
+        np.subtract(lifetime, 1, out=lifetime, where=alive)
+
+    def cull_bullets(x, y, lifetime, alive, width, height, game_width, game_height):
+        """Deactivate bullets that are off-screen or whose lifetime has expired."""
+        alive &= (
+            (lifetime > 0)
+            & (x + width >= 0)
+            & (x <= game_width)
+            & (y + height >= 0)
+            & (y <= game_height)
+        )
+
+    def move_enemies(pos, size, vel, alive, wall_rects) -> None:
+        """
+        Move the active enemies first horizontally, then vertically. An enemy that ends
+        up inside a wall is pushed back along that axis and reverses that direction.
+        """
+        for axis in range(2):
+            np.add(pos[:, axis], vel[:, axis], out=pos[:, axis], where=alive)
+            lo: np.ndarray = pos
+            hi: np.ndarray = pos + size
+            hit: np.ndarray = (
+                alive[:, None]
+                & (lo[:, None, 0] < wall_rects[None, :, 2])
+                & (hi[:, None, 0] > wall_rects[None, :, 0])
+                & (lo[:, None, 1] < wall_rects[None, :, 3])
+                & (hi[:, None, 1] > wall_rects[None, :, 1])
+            )
+            hit_any: np.ndarray = hit.any(axis=1)
+            if not hit_any.any():
+                continue
+            forward: np.ndarray = hit_any & (vel[:, axis] > 0)
+            backward: np.ndarray = hit_any & (vel[:, axis] < 0)
+            near_edges: np.ndarray = wall_rects[None, :, axis]
+            far_edges: np.ndarray = wall_rects[None, :, axis + 2]
+            wall_near: np.ndarray = np.where(hit, near_edges, np.inf).min(axis=1)
+            wall_far: np.ndarray = np.where(hit, far_edges, -np.inf).max(axis=1)
+            pos[forward, axis] = wall_near[forward] - size[forward, axis]
+            pos[backward, axis] = wall_far[backward]
+            vel[hit_any, axis] *= -1  # Reverse direction upon collision
+
+
+def warm_up_kernels() -> None:
+    """
+    Run the hot loop kernels once on small arrays of the gameplay dtypes,
+    so Numba compiles them up front and not on the first gameplay frame.
+    """
+    coords: np.ndarray = np.zeros(1, np.float32)
+    lifetime: np.ndarray = np.zeros(1, np.int32)
+    alive: np.ndarray = np.zeros(1, bool)
+    move_bullets(coords, coords, coords, coords, lifetime, alive)
+    cull_bullets(coords, coords, lifetime, alive, 0, 0, 0, 0)
+    move_enemies(
+        np.zeros((1, 2), np.float32),
+        np.zeros((1, 2), np.int32),
+        np.zeros((1, 2), np.float32),
+        alive,
+        np.zeros((1, 4), np.int32),
+    )
+
+
 # -------------------------
 # Forward Declaration for Type Hinting
 # -------------------------
@@ -57,6 +260,18 @@ class Game:
     pass
 
 
+class BulletPool:
+    pass
+
+
+class EnemySoA:
+    pass
+
+
+class Room:
+    pass
+
+
 # -------------------------
 # Player Class
 # -------------------------
@@ -73,6 +288,7 @@ class Player(pygame.sprite.Sprite):
     INITIAL_HEALTH = 3
     INITIAL_SHOOT_COOLDOWN = 20
     DIAGONAL_MOVEMENT_FACTOR = Constants.DIAGONAL_MOVEMENT_FACTOR
+    MOVE_TABLE = build_move_table(DIAGONAL_MOVEMENT_FACTOR)
     BLINK_SPEED = 3  # Used to control blinking speed when immune
     ANIMATION_SPEED = 0.1
     IMMUNITY_DURATION_SECONDS = (
@@ -84,10 +300,23 @@ class Player(pygame.sprite.Sprite):
     PLAYER_MIN_ALPHA = 100  # Minimum alpha value during blink
     PLAYER_MAX_ALPHA = 255  # Maximum alpha value during blink
 
+    # Blink alpha values for every tick of one blink period, so the current tick count
+    # modulo the period indexes the lookup table directly
+    BLINK_TICKS = round(PLAYER_TIME_FACTOR_DIVISOR / BLINK_SPEED)
+    BLINK_LUT_PHASES = np.arange(BLINK_TICKS) * (Constants.TWO_PI / BLINK_TICKS)
+    ALPHA_LUT: np.ndarray = (
+        PLAYER_MIN_ALPHA
+        + (PLAYER_MAX_ALPHA - PLAYER_MIN_ALPHA) * (0.5 + 0.5 * np.sin(BLINK_LUT_PHASES))
+    ).astype(np.uint8)
+
     SHOOT_SOUND = None
 
     DAMAGED_SOUND = None
 
+    FRAMES: List[List[pygame.Surface]] = None  # Animation frames shared by all players
+    # Scratch copies of the animation frames whose opacity is changed while blinking
+    BLINK_FRAMES: List[List[pygame.Surface]] = None
+
     @staticmethod
     def set_shoot_sound() -> None:
         """Set enemy dead sound."""
@@ -100,6 +329,53 @@ class Player(pygame.sprite.Sprite):
         Player.DAMAGED_SOUND = pygame.mixer.Sound("audio/recive_damage.mp3")
         Player.DAMAGED_SOUND.set_volume(0.2)
 
+    @staticmethod
+    def load_frames() -> None:
+        """Load and scale the player animation frames if they have not been loaded already."""
+        if Player.FRAMES is None:
+            frames: List[List[pygame.Surface]] = []
+            # Normal walking animation
+            frames.append(
+                [
+                    pygame.transform.rotozoom(
+                        pygame.image.load(
+                            "graphics/player/player_walk_1.png"
+                        ).convert_alpha(),
+                        0,
+                        Player.PLAYER_SCALE_FACTOR,
+                    ),
+                    pygame.transform.rotozoom(
+                        pygame.image.load(
+                            "graphics/player/player_walk_2.png"
+                        ).convert_alpha(),
+                        0,
+                        Player.PLAYER_SCALE_FACTOR,
+                    ),
+                ]
+            )
+
+            # Damaged walking animation
+            frames.append(
+                [
+                    pygame.transform.rotozoom(
+                        pygame.image.load(
+                            "graphics/player/player_walk_1_damaged.png"
+                        ).convert_alpha(),
+                        0,
+                        Player.PLAYER_SCALE_FACTOR,
+                    ),
+                    pygame.transform.rotozoom(
+                        pygame.image.load(
+                            "graphics/player/player_walk_2_damaged.png"
+                        ).convert_alpha(),
+                        0,
+                        Player.PLAYER_SCALE_FACTOR,
+                    ),
+                ]
+            )
+            Player.FRAMES = frames
+            Player.BLINK_FRAMES = [[frame.copy() for frame in row] for row in frames]
+
     def __init__(self, x: int, y: int, game: Game) -> None:
         """
         Initialize the player with starting position, load animations, and set initial attributes.
@@ -107,48 +383,9 @@ class Player(pygame.sprite.Sprite):
         super().__init__()
         self.game = game
 
-
-        # Load and scale player images for animations (normal and damaged)
-        self.moves: List[List[pygame.Surface]] = []
-        # Normal walking animation
-        self.moves.append(
-            [
-                pygame.transform.rotozoom(
-                    pygame.image.load(
-                        "graphics/player/player_walk_1.png"
-                    ).convert_alpha(),
-                    0,
-                    Player.PLAYER_SCALE_FACTOR,
-                ),
-                pygame.transform.rotozoom(
-                    pygame.image.load(
-                        "graphics/player/player_walk_2.png"
-                    ).convert_alpha(),
-                    0,
-                    Player.PLAYER_SCALE_FACTOR,
-                ),
-            ]
-        )
-
-        # Damaged walking animation
-        self.moves.append(
-            [
-                pygame.transform.rotozoom(
-                    pygame.image.load(
-                        "graphics/player/player_walk_1_damaged.png"
-                    ).convert_alpha(),
-                    0,
-                    Player.PLAYER_SCALE_FACTOR,
-                ),
-                pygame.transform.rotozoom(
-                    pygame.image.load(
-                        "graphics/player/player_walk_2_damaged.png"
-                    ).convert_alpha(),
-                    0,
-                    Player.PLAYER_SCALE_FACTOR,
-                ),
-            ]
-        )
+        # Player images for animations (normal and damaged), shared by all players
+        Player.load_frames()
+        self.moves: List[List[pygame.Surface]] = Player.FRAMES
 
         # Initialize attributes
         self.damage: int = 1
@@ -166,6 +403,17 @@ class Player(pygame.sprite.Sprite):
         self.shoot_cooldown_set: int = self.INITIAL_SHOOT_COOLDOWN
         self.immunity_duration: int = self.IMMUNITY_DURATION_SECONDS * game.FPS
 
+    def blink_frame(self, frame: int) -> pygame.Surface:
+        """
+        Return the given frame of the current animation set with the blink opacity
+        for the current time. Only the alpha of a preallocated copy is changed.
+        """
+        image: pygame.Surface = Player.BLINK_FRAMES[self.move_set][frame]
+        image.set_alpha(
+            int(Player.ALPHA_LUT[pygame.time.get_ticks() % Player.BLINK_TICKS])
+        )
+        return image
+
     def player_animation(self) -> None:
         """
         Update the player's animation frame.
@@ -175,30 +423,15 @@ class Player(pygame.sprite.Sprite):
         if self.playerMoveIndex >= len(self.moves[self.move_set]):
             self.playerMoveIndex = 0
 
-        # Retrieve the current animation frame
-        current_frame: pygame.Surface = self.moves[self.move_set][
-            int(self.playerMoveIndex)
-        ]
-
         if self.is_immune:
-            t: float = (
-                pygame.time.get_ticks() / Player.PLAYER_TIME_FACTOR_DIVISOR
-            )  # Time factor for oscillation
-            alpha: int = int(
-                Player.PLAYER_MIN_ALPHA
-                + (Player.PLAYER_MAX_ALPHA - Player.PLAYER_MIN_ALPHA)
-                * (0.5 + 0.5 * math.sin(Player.BLINK_SPEED * t * Constants.TWO_PI))
-            )
-            # Create a copy and set its transparency without altering position/size
-            frame_with_alpha: pygame.Surface = current_frame.copy()
-            frame_with_alpha.set_alpha(alpha)
-            self.image = frame_with_alpha
+            # Use the transparent copy of the frame without altering position/size
+            self.image = self.blink_frame(int(self.playerMoveIndex))
         else:
-            self.image = current_frame
+            self.image = self.moves[self.move_set][int(self.playerMoveIndex)]
 
-    def update(self, walls: pygame.sprite.Group) -> None:
+    def update(self, room: Room) -> None:
         """
-        Update player state: movement, collision with walls, and immunity timer.
+        Update player state: movement, collision with the room's walls, and immunity timer.
         """
         if self.is_immune:
             self.immunity_timer -= 1
@@ -207,46 +440,45 @@ class Player(pygame.sprite.Sprite):
                 self.move_set = 0  # Return to normal animation set
                 self.image = self.moves[0][int(self.playerMoveIndex)]
 
-        # Handle movement based on key presses
+        # Handle movement based on key presses: the key state mask selects a precomputed
+        # direction, so there is no branch per key and at most one animation call
         keys = pygame.key.get_pressed()
-        dx: float = 0
-        dy: float = 0
+        mask: int = (
+            (keys[pygame.K_a] or keys[pygame.K_LEFT])
+            | (keys[pygame.K_d] or keys[pygame.K_RIGHT]) << 1
+            | (keys[pygame.K_w] or keys[pygame.K_UP]) << 2
+            | (keys[pygame.K_s] or keys[pygame.K_DOWN]) << 3
+        )
+        direction_x, direction_y = Player.MOVE_TABLE[mask]
+        dx: float = direction_x * self.speed
+        dy: float = direction_y * self.speed
 
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            dx = -self.speed
-            self.player_animation()
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            dx = self.speed
-            self.player_animation()
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            dy = -self.speed
-            self.player_animation()
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            dy = self.speed
+        if dx or dy:
             self.player_animation()
 
-        # Normalize diagonal movement so it isn't faster than horizontal/vertical movement
-        if dx != 0 and dy != 0:
-            dx *= Player.DIAGONAL_MOVEMENT_FACTOR
-            dy *= Player.DIAGONAL_MOVEMENT_FACTOR
+        # Query the wall grid once for the whole area swept by this frame's movement
+        moved_rect: pygame.Rect = self.rect.copy()
+        moved_rect.x += dx
+        moved_rect.y += dy
+        candidates: List[List[int]] = room.wall_xyxy[
+            room.broadphase(self.rect.union(moved_rect))
+        ].tolist()
 
         # Move horizontally and resolve collisions with walls
         self.rect.x += dx
-        wall_hit = pygame.sprite.spritecollide(self, walls, False)
-        for wall in wall_hit:
+        for left, _, right, _ in overlapping(self.rect, candidates):
             if dx > 0:
-                self.rect.right = wall.rect.left
+                self.rect.right = left
             elif dx < 0:
-                self.rect.left = wall.rect.right
+                self.rect.left = right
 
         # Move vertically and resolve collisions with walls
         self.rect.y += dy
-        wall_hit = pygame.sprite.spritecollide(self, walls, False)
-        for wall in wall_hit:
+        for _, top, _, bottom in overlapping(self.rect, candidates):
             if dy > 0:
-                self.rect.bottom = wall.rect.top
+                self.rect.bottom = top
             elif dy < 0:
-                self.rect.top = wall.rect.bottom
+                self.rect.top = bottom
 
         # Keep player within game boundaries
         self.rect.x = max(0, min(self.game.WIDTH - self.rect.width, self.rect.x))
@@ -256,22 +488,25 @@ class Player(pygame.sprite.Sprite):
         if self.shoot_cooldown > 0:
             self.shoot_cooldown -= 1
 
-    def shoot(self, bullets: pygame.sprite.Group) -> None:
+    def shoot(self, bullets: BulletPool) -> None:
         """
-        Create and fire a bullet if the shooting cooldown has expired.
+        Fire a bullet from the pool if the shooting cooldown has expired.
         The bullet travels from the player toward the mouse position.
         """
         if self.shoot_cooldown == 0:
             mouse_x, mouse_y = pygame.mouse.get_pos()
             dx: float = mouse_x - self.rect.centerx
             dy: float = mouse_y - self.rect.centery
-            dist: float = math.hypot(dx, dy)
-            if dist == 0:
+            if dx == 0 and dy == 0:
                 return
-            dx, dy = dx / dist, dy / dist  # Normalize direction vector
-            bullet = Bullet(self.rect.centerx, self.rect.centery, dx, dy, self.game)
+            dx, dy = fast_norm(dx, dy)  # Normalize direction vector
+            bullets.spawn(
+                self.rect.centerx,
+                self.rect.centery,
+                dx * Bullet.CURRENT_BULLET_SPEED,
+                dy * Bullet.CURRENT_BULLET_SPEED,
+            )
             Player.SHOOT_SOUND.play()
-            bullets.add(bullet)
             self.shoot_cooldown = self.shoot_cooldown_set
 
     def take_damage(self) -> None:
@@ -294,18 +529,9 @@ class Player(pygame.sprite.Sprite):
         Update the player's image with a blinking effect during immunity.
         """
         self.move_set = 1  # Switch to damaged animation set
-        current_frame: pygame.Surface = self.moves[self.move_set][
+        self.image = self.blink_frame(
             int(self.playerMoveIndex) % len(self.moves[self.move_set])
-        ]
-        t: float = pygame.time.get_ticks() / Player.PLAYER_TIME_FACTOR_DIVISOR
-        alpha: int = int(
-            Player.PLAYER_MIN_ALPHA
-            + (Player.PLAYER_MAX_ALPHA - Player.PLAYER_MIN_ALPHA)
-            * (0.5 + 0.5 * math.sin(Player.BLINK_SPEED * t * Constants.TWO_PI))
         )
-        image_with_alpha: pygame.Surface = current_frame.copy()
-        image_with_alpha.set_alpha(alpha)
-        self.image = image_with_alpha
 
     def resetLocation(self) -> None:
         """
@@ -380,10 +606,10 @@ class Player(pygame.sprite.Sprite):
 # -------------------------
 # Bullet Class
 # -------------------------
-class Bullet(pygame.sprite.Sprite):
+class Bullet:
     """
-    The Bullet class represents projectiles fired by the player.
-    It handles bullet movement, collision detection, and lifetime.
+    The Bullet class is a lightweight view of a single projectile stored in a BulletPool.
+    It also holds the bullet speed settings and the image shared by all bullets.
     """
 
     MAX_BULLET_SPEED: int = 30
@@ -392,6 +618,18 @@ class Bullet(pygame.sprite.Sprite):
     INITIAL_LIFETIME = 60
     BULLET_SCALE_FACTOR = 0.12
 
+    image = None  # Shared image among all bullets
+
+    @classmethod
+    def load_frames(cls) -> None:
+        """Load and scale the bullet image if it has not been loaded already."""
+        if cls.image is None:
+            cls.image = pygame.transform.rotozoom(
+                pygame.image.load("graphics/bullets/bullet.png").convert_alpha(),
+                0,
+                Bullet.BULLET_SCALE_FACTOR,
+            )
+
     @staticmethod
     def set_bullet_speed(number: int) -> None:
         """
@@ -408,55 +646,182 @@ class Bullet(pygame.sprite.Sprite):
             Bullet.MAX_BULLET_SPEED, Bullet.CURRENT_BULLET_SPEED + number
         )
 
-    def __init__(self, x: int, y: int, dx: float, dy: float, game: Game) -> None:
+    def __init__(self, pool: BulletPool, index: int) -> None:
         """
-        Initialize a bullet at position (x, y) with a direction (dx, dy).
+        Initialize a view of the bullet stored at the given index of the pool.
         """
-        super().__init__()
-        self.game = game
-        # Load and scale the bullet image
-        self.image: pygame.Surface = pygame.transform.rotozoom(
-            pygame.image.load("graphics/bullets/bullet.png").convert_alpha(),
-            0,
-            Bullet.BULLET_SCALE_FACTOR,
+        self.pool = pool
+        self.index = index
+
+    @property
+    def rect(self) -> pygame.Rect:
+        """Return the bullet's current bounding rectangle."""
+        return pygame.Rect(
+            int(self.pool.x[self.index]),
+            int(self.pool.y[self.index]),
+            self.pool.width,
+            self.pool.height,
         )
-        self.rect: pygame.Rect = self.image.get_rect(center=(x, y))
-        # Set bullet velocity
-        self.dx: float = dx * Bullet.CURRENT_BULLET_SPEED
-        self.dy: float = dy * Bullet.CURRENT_BULLET_SPEED
-        self.lifetime: int = Bullet.INITIAL_LIFETIME
 
-    def update(
-        self, walls: pygame.sprite.Group, enemies: pygame.sprite.Group, player: Player
-    ) -> None:
+    @property
+    def lifetime(self) -> int:
+        """Return the remaining lifetime of the bullet in frames."""
+        return int(self.pool.lifetime[self.index])
+
+    def alive(self) -> bool:
+        """Return True if the bullet is still active."""
+        return bool(self.pool.alive[self.index])
+
+    def kill(self) -> None:
+        """Deactivate the bullet, freeing its slot in the pool."""
+        self.pool.alive[self.index] = False
+
+
+# -------------------------
+# Bullet Pool Class
+# -------------------------
+class BulletPool:
+    """
+    The BulletPool class stores all bullets as parallel NumPy arrays (structure of arrays),
+    so movement, lifetime and off-screen checks run as a single vectorized step per frame.
+    """
+
+    INITIAL_CAPACITY = 64
+    VECTORIZE_MIN_PAIRS = 64  # Fewer bullet/enemy pairs are checked in plain Python
+
+    def __init__(self, game: Game, capacity: int = INITIAL_CAPACITY) -> None:
         """
-        Update bullet's position, check for collisions with walls and enemies,
-        and reduce lifetime. Kill the bullet if conditions are met.
+        Initialize an empty pool able to hold the given number of bullets.
         """
-        self.rect.x += self.dx
-        self.rect.y += self.dy
-        self.lifetime -= 1
+        self.game = game
+        Bullet.load_frames()  # Ensure image is loaded once
+        self.width, self.height = Bullet.image.get_size()
+        self.x: np.ndarray = np.zeros(capacity, np.float32)  # Top-left x position
+        self.y: np.ndarray = np.zeros(capacity, np.float32)  # Top-left y position
+        self.dx: np.ndarray = np.zeros(capacity, np.float32)
+        self.dy: np.ndarray = np.zeros(capacity, np.float32)
+        self.lifetime: np.ndarray = np.zeros(capacity, np.int32)
+        self.alive: np.ndarray = np.zeros(capacity, bool)
+
+    def __len__(self) -> int:
+        """Return the number of active bullets."""
+        return int(np.count_nonzero(self.alive))
+
+    def _grow(self) -> None:
+        """Double the capacity of the pool, keeping existing bullets."""
+        for name in ("x", "y", "dx", "dy", "lifetime", "alive"):
+            array: np.ndarray = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros_like(array))))
+
+    def spawn(self, x: float, y: float, dx: float, dy: float) -> None:
+        """
+        Activate a bullet centered at (x, y) with velocity (dx, dy) in the first free slot.
+        """
+        free: np.ndarray = ~self.alive
+        if not free.any():
+            self._grow()
+            free = ~self.alive
+        i: int = int(np.argmax(free))
+        self.x[i] = x - self.width // 2
+        self.y[i] = y - self.height // 2
+        self.dx[i] = dx
+        self.dy[i] = dy
+        self.lifetime[i] = Bullet.INITIAL_LIFETIME
+        self.alive[i] = True
+
+    def get_element(self, index: int) -> Bullet:
+        """Return a Bullet view of the given slot."""
+        return Bullet(self, index)
+
+    def empty(self) -> None:
+        """Deactivate all bullets."""
+        self.alive[:] = False
+
+    def update(self, room: Room, player: Player) -> None:
+        """
+        Move all active bullets, check for collisions with the room's walls and enemies,
+        and reduce lifetime. Deactivate bullets when conditions are met.
+        """
+        move_bullets(self.x, self.y, self.dx, self.dy, self.lifetime, self.alive)
+
+        active: np.ndarray = np.flatnonzero(self.alive)
 
         # Collision with walls
-        if pygame.sprite.spritecollide(self, walls, False):
-            self.kill()
+        self.hit_walls(active, room.wall_xyxy)
 
         # Collision with enemies
-        hits = pygame.sprite.spritecollide(self, enemies, False)
-        for enemy in hits:
-            enemy.health -= player.get_damage()
-            self.kill()
-            break
-
-        # Remove bullet if off-screen or lifetime has expired
-        if (
-            self.rect.right < 0
-            or self.rect.left > self.game.WIDTH
-            or self.rect.bottom < 0
-            or self.rect.top > self.game.HEIGHT
-            or self.lifetime <= 0
-        ):
-            self.kill()
+        self.hit_enemies(active, room.enemies, player.get_damage())
+
+        # Remove bullets that are off-screen or whose lifetime has expired
+        cull_bullets(
+            self.x,
+            self.y,
+            self.lifetime,
+            self.alive,
+            self.width,
+            self.height,
+            self.game.WIDTH,
+            self.game.HEIGHT,
+        )
+
+    def hit_walls(self, active: np.ndarray, wall_xyxy: np.ndarray) -> None:
+        """
+        Deactivate the given bullets that overlap any of the walls given as (x1, y1, x2, y2)
+        rows, testing all bullet/wall pairs at once with NumPy broadcasting.
+        """
+        bx: np.ndarray = self.x[active, None]
+        by: np.ndarray = self.y[active, None]
+        hit: np.ndarray = (
+            (bx < wall_xyxy[None, :, 2])
+            & (bx + self.width > wall_xyxy[None, :, 0])
+            & (by < wall_xyxy[None, :, 3])
+            & (by + self.height > wall_xyxy[None, :, 1])
+        ).any(axis=1)
+        self.alive[active[hit]] = False
+
+    def hit_enemies(self, active: np.ndarray, enemies: EnemySoA, damage: int) -> None:
+        """
+        Damage the first enemy hit by each of the given bullets and deactivate those bullets.
+        The bullet/enemy overlaps are computed at once with NumPy broadcasting,
+        except for a handful of pairs where a plain Python scan is cheaper.
+        """
+        targets: np.ndarray = np.flatnonzero(enemies.alive)
+        if active.size * targets.size < BulletPool.VECTORIZE_MIN_PAIRS:
+            for i in active:
+                enemy = pygame.sprite.spritecollideany(self.get_element(i), enemies)
+                if enemy is not None:
+                    enemies.health[enemy.slot] -= damage
+                    self.alive[i] = False
+            return
+
+        bx: np.ndarray = self.x[active, None]
+        by: np.ndarray = self.y[active, None]
+        emin: np.ndarray = enemies.pos[targets]
+        emax: np.ndarray = emin + enemies.size[targets]
+        hit: np.ndarray = (
+            (bx < emax[None, :, 0])
+            & (bx + self.width > emin[None, :, 0])
+            & (by < emax[None, :, 1])
+            & (by + self.height > emin[None, :, 1])
+        )
+        hit_any: np.ndarray = hit.any(axis=1)
+        first_hit: np.ndarray = targets[np.argmax(hit, axis=1)[hit_any]]
+        np.subtract.at(enemies.health, first_hit, damage)
+        self.alive[active[hit_any]] = False
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw all active bullets with a single batched blit."""
+        active: np.ndarray = np.flatnonzero(self.alive)
+        screen.blits(
+            [
+                (Bullet.image, (x, y))
+                for x, y in zip(
+                    self.x[active].astype(np.int32).tolist(),
+                    self.y[active].astype(np.int32).tolist(),
+                )
+            ],
+            False,
+        )
 
 
 # -------------------------
@@ -464,8 +829,8 @@ class Bullet(pygame.sprite.Sprite):
 # -------------------------
 class Enemy(pygame.sprite.Sprite):
     """
-    The Enemy class represents a basic enemy with movement, animation,
-    and health management.
+    The Enemy class represents a basic enemy with its animations and starting attributes.
+    Movement, animation and health are managed by the EnemySoA group it belongs to.
     """
 
     max_health: int = 3
@@ -483,6 +848,24 @@ class Enemy(pygame.sprite.Sprite):
     ENEMY_SCALE_FACTOR = 0.3
     ENEMY_ANIMATION_SPEED_INCREMENT = 0.1
     DEAD_ENEMY_SOUND = None
+    FRAMES: List[pygame.Surface] = None  # Animation frames shared by all enemies
+
+    @staticmethod
+    def load_frames() -> None:
+        """Load and scale the enemy animation frames if they have not been loaded already."""
+        if Enemy.FRAMES is None:
+            Enemy.FRAMES = [
+                pygame.transform.rotozoom(
+                    pygame.image.load("graphics/enemies/bat_1.png").convert_alpha(),
+                    0,
+                    Enemy.ENEMY_SCALE_FACTOR,
+                ),
+                pygame.transform.rotozoom(
+                    pygame.image.load("graphics/enemies/bat_2.png").convert_alpha(),
+                    0,
+                    Enemy.ENEMY_SCALE_FACTOR,
+                ),
+            ]
 
     @staticmethod
     def set_sound() -> None:
@@ -536,96 +919,17 @@ class Enemy(pygame.sprite.Sprite):
         """
         super().__init__()
 
-        # Load enemy animation frames and scale images
-        self.moves: List[pygame.Surface] = [
-            pygame.transform.rotozoom(
-                pygame.image.load("graphics/enemies/bat_1.png").convert_alpha(),
-                0,
-                Enemy.ENEMY_SCALE_FACTOR,
-            ),
-            pygame.transform.rotozoom(
-                pygame.image.load("graphics/enemies/bat_2.png").convert_alpha(),
-                0,
-                Enemy.ENEMY_SCALE_FACTOR,
-            ),
-        ]
+        # Enemy animation frames, shared by all enemies
+        Enemy.load_frames()
+        self.moves: List[pygame.Surface] = Enemy.FRAMES
 
         self.game = game
         self.rect: pygame.Rect = self.moves[0].get_rect(center=(x, y))
+        # Starting values, copied into the EnemySoA arrays when the enemy is added to it
         self.speed: float = Enemy.get_speed()
-        self.move_timer: int = 0  # Timer for when to change movement direction
-        self.dx: float = 0  # Horizontal velocity component
-        self.dy: float = 0  # Vertical velocity component
         self.image: pygame.Surface = self.moves[0]
-        self.enemyMoveIndex: float = 0  # Animation frame index
-        self.health: int = Enemy.max_health
-
-    def update(self, player: Player, walls: pygame.sprite.Group) -> None:
-        """
-        Update enemy movement toward the player with added randomness,
-        handle collisions with walls, update animation, and check for death.
-        """
-        if self.move_timer <= 0:
-            # Calculate normalized direction vector toward the player
-            dx: float = player.rect.centerx - self.rect.centerx
-            dy: float = player.rect.centery - self.rect.centery
-            dist: float = math.hypot(dx, dy)
-            if dist != 0:
-                dx, dy = dx / dist, dy / dist
-            # Add randomness to the direction
-            dx += random.uniform(
-                -Enemy.DIRECTION_RANDOMNESS_RANGE, Enemy.DIRECTION_RANDOMNESS_RANGE
-            )
-            dy += random.uniform(
-                -Enemy.DIRECTION_RANDOMNESS_RANGE, Enemy.DIRECTION_RANDOMNESS_RANGE
-            )
-            dist = math.hypot(dx, dy)
-            if dist != 0:
-                dx, dy = dx / dist, dy / dist
-            self.dx, self.dy = dx * self.speed, dy * self.speed
-            self.move_timer = random.randint(
-                Enemy.ENEMY_MOVEMENT_CHANGE_MIN, Enemy.ENEMY_MOVEMENT_CHANGE_MAX
-            )
-        else:
-            self.move_timer -= 1
-
-        # Update enemy animation
-        self.enemy_animation()
-
-        # Horizontal movement and wall collision
-        self.rect.x += self.dx
-        wall_hit = pygame.sprite.spritecollide(self, walls, False)
-        for wall in wall_hit:
-            if self.dx > 0:
-                self.rect.right = wall.rect.left
-            elif self.dx < 0:
-                self.rect.left = wall.rect.right
-            self.dx *= -1  # Reverse horizontal direction upon collision
-
-        # Vertical movement and wall collision
-        self.rect.y += self.dy
-        wall_hit = pygame.sprite.spritecollide(self, walls, False)
-        for wall in wall_hit:
-            if self.dy > 0:
-                self.rect.bottom = wall.rect.top
-            elif self.dy < 0:
-                self.rect.top = wall.rect.bottom
-            self.dy *= -1  # Reverse vertical direction upon collision
-
-        # If health is zero or below, award points to player and remove enemy
-        if int(self.health) <= 0:
-            player.add_points(Enemy.POINTS)
-            Enemy.DEAD_ENEMY_SOUND.play()
-            self.kill()
-
-    def enemy_animation(self) -> None:
-        """
-        Update the enemy animation frame for smooth transitions.
-        """
-        self.enemyMoveIndex += Enemy.ENEMY_ANIMATION_SPEED_INCREMENT
-        if self.enemyMoveIndex >= len(self.moves):
-            self.enemyMoveIndex = 0
-        self.image = self.moves[int(self.enemyMoveIndex)]
+        self.health: float = Enemy.max_health
+        self.slot: int = -1  # Index of the enemy in its EnemySoA
 
 
 # -------------------------
@@ -646,6 +950,24 @@ class BossEnemy(Enemy):
     BOSS_HEALTH_SCALING = 3
     DAMAGE_SCALING_DIVISOR = 4
     BOSS_SCALE_FACTOR = 0.5
+    FRAMES: List[pygame.Surface] = None  # Animation frames shared by all bosses
+
+    @staticmethod
+    def load_frames() -> None:
+        """Load and scale the boss animation frames if they have not been loaded already."""
+        if BossEnemy.FRAMES is None:
+            BossEnemy.FRAMES = [
+                pygame.transform.rotozoom(
+                    pygame.image.load("graphics/enemies/phoenix1.png").convert_alpha(),
+                    0,
+                    BossEnemy.BOSS_SCALE_FACTOR,
+                ),
+                pygame.transform.rotozoom(
+                    pygame.image.load("graphics/enemies/phoenix2.png").convert_alpha(),
+                    0,
+                    BossEnemy.BOSS_SCALE_FACTOR,
+                ),
+            ]
 
     @staticmethod
     def get_speed() -> float:
@@ -662,19 +984,9 @@ class BossEnemy(Enemy):
         then override attributes and load boss-specific animations.
         """
         super().__init__(x, y, game)
-        # Load boss-specific images and scale them
-        self.moves = [
-            pygame.transform.rotozoom(
-                pygame.image.load("graphics/enemies/phoenix1.png").convert_alpha(),
-                0,
-                BossEnemy.BOSS_SCALE_FACTOR,
-            ),
-            pygame.transform.rotozoom(
-                pygame.image.load("graphics/enemies/phoenix2.png").convert_alpha(),
-                0,
-                BossEnemy.BOSS_SCALE_FACTOR,
-            ),
-        ]
+        # Boss-specific animation frames, shared by all bosses
+        BossEnemy.load_frames()
+        self.moves = BossEnemy.FRAMES
         self.speed = BossEnemy.get_speed()
         # Scale health and damage based on current level
         self.health = (
@@ -694,6 +1006,171 @@ class BossEnemy(Enemy):
         return BossEnemy.damage
 
 
+# -------------------------
+# Enemy Structure of Arrays
+# -------------------------
+class EnemySoA(pygame.sprite.Group):
+    """
+    The EnemySoA class is a sprite group that stores the movement state of its enemies
+    in parallel NumPy arrays (structure of arrays), so all enemies are steered,
+    moved and checked against walls in a single vectorized pass per frame.
+    The enemy sprites only keep their image and rect, which are synced for drawing.
+    """
+
+    INITIAL_CAPACITY = 16
+    FIELDS = (
+        "pos",
+        "size",
+        "vel",
+        "speed",
+        "move_timer",
+        "health",
+        "anim_index",
+        "frame_count",
+        "alive",
+    )
+
+    def __init__(self, *sprites: Enemy) -> None:
+        """
+        Initialize empty enemy arrays and add the given sprites.
+        """
+        capacity: int = EnemySoA.INITIAL_CAPACITY
+        self.pos: np.ndarray = np.zeros((capacity, 2), np.float32)  # Top-left corner
+        self.size: np.ndarray = np.zeros((capacity, 2), np.int32)
+        self.vel: np.ndarray = np.zeros((capacity, 2), np.float32)
+        self.speed: np.ndarray = np.zeros(capacity, np.float32)
+        self.move_timer: np.ndarray = np.zeros(capacity, np.int32)
+        # Health is fractional since enemy max health grows by fractional steps
+        self.health: np.ndarray = np.zeros(capacity, np.float32)
+        self.anim_index: np.ndarray = np.zeros(capacity, np.float32)
+        self.frame_count: np.ndarray = np.zeros(capacity, np.int32)
+        self.alive: np.ndarray = np.zeros(capacity, bool)
+        self.slot_sprites: List[Enemy] = [None] * capacity
+        super().__init__(*sprites)
+
+    def _grow(self) -> None:
+        """Double the capacity of the arrays, keeping existing enemies."""
+        for name in EnemySoA.FIELDS:
+            array: np.ndarray = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros_like(array))))
+        self.slot_sprites.extend([None] * len(self.slot_sprites))
+
+    def add_internal(self, sprite: Enemy, layer=None) -> None:
+        """
+        Add an enemy to the group and copy its starting state into a free slot.
+        """
+        super().add_internal(sprite, layer)
+        free: np.ndarray = ~self.alive
+        if not free.any():
+            self._grow()
+            free = ~self.alive
+        i: int = int(np.argmax(free))
+        self.pos[i] = sprite.rect.topleft
+        self.size[i] = sprite.rect.size
+        self.vel[i] = 0
+        self.speed[i] = sprite.speed
+        self.move_timer[i] = 0
+        self.health[i] = sprite.health
+        self.anim_index[i] = 0
+        self.frame_count[i] = len(sprite.moves)
+        self.alive[i] = True
+        self.slot_sprites[i] = sprite
+        sprite.slot = i
+
+    def remove_internal(self, sprite: Enemy) -> None:
+        """
+        Remove an enemy from the group and free its slot.
+        """
+        super().remove_internal(sprite)
+        self.alive[sprite.slot] = False
+        self.slot_sprites[sprite.slot] = None
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> None:
+        """Normalize the given (n, 2) vectors in place, leaving zero vectors untouched."""
+        length_sq: np.ndarray = np.einsum("ij,ij->i", vectors, vectors)[:, None]
+        inv_length: np.ndarray = np.zeros_like(length_sq)
+        np.power(length_sq, -0.5, out=inv_length, where=length_sq != 0)
+        vectors *= inv_length
+
+    def tick(self, player_xy: tuple, wall_rects: np.ndarray) -> None:
+        """
+        Steer all enemies toward the player with added randomness, move them,
+        resolve collisions with the walls given as (x1, y1, x2, y2) rows
+        and advance their animation.
+        """
+        alive: np.ndarray = self.alive
+
+        # Pick a new direction for enemies whose movement timer ran out
+        change: np.ndarray = np.flatnonzero(alive & (self.move_timer <= 0))
+        self.move_timer[alive & (self.move_timer > 0)] -= 1
+        if change.size:
+            direction: np.ndarray = (
+                np.asarray(player_xy, np.float32)
+                - self.pos[change]
+                - self.size[change] // 2
+            )
+            EnemySoA._normalize(direction)
+            direction += Room.rng.uniform(
+                -Enemy.DIRECTION_RANDOMNESS_RANGE,
+                Enemy.DIRECTION_RANDOMNESS_RANGE,
+                (change.size, 2),
+            )
+            EnemySoA._normalize(direction)
+            self.vel[change] = direction * self.speed[change, None]
+            self.move_timer[change] = Room.rng.integers(
+                Enemy.ENEMY_MOVEMENT_CHANGE_MIN,
+                Enemy.ENEMY_MOVEMENT_CHANGE_MAX,
+                change.size,
+                endpoint=True,
+            )
+
+        # Update enemy animation
+        self.anim_index[alive] += Enemy.ENEMY_ANIMATION_SPEED_INCREMENT
+        self.anim_index[self.anim_index >= self.frame_count] = 0
+
+        # Horizontal and vertical movement with wall collision
+        move_enemies(self.pos, self.size, self.vel, alive, wall_rects)
+
+    def update(self, player: Player, wall_xyxy: np.ndarray) -> None:
+        """
+        Update all enemies against the walls given as (x1, y1, x2, y2) rows, sync their
+        rects for collision checks and remove dead enemies, awarding points to the player.
+        """
+        self.tick(player.rect.center, wall_xyxy)
+
+        active: np.ndarray = np.flatnonzero(self.alive)
+        for i, topleft in zip(
+            active.tolist(), self.pos[active].astype(np.int32).tolist()
+        ):
+            self.slot_sprites[i].rect.topleft = topleft
+
+        # If health is zero or below, award points to player and remove enemy
+        for i in np.flatnonzero(self.alive & (self.health < 1)).tolist():
+            player.add_points(Enemy.POINTS)
+            Enemy.DEAD_ENEMY_SOUND.play()
+            self.slot_sprites[i].kill()
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """
+        Draw all enemies with a single batched blit, picking each animation frame
+        and position straight from the arrays.
+        """
+        active: np.ndarray = np.flatnonzero(self.alive)
+        screen.blits(
+            [
+                (self.slot_sprites[i].moves[frame], (x, y))
+                for i, frame, x, y in zip(
+                    active.tolist(),
+                    self.anim_index[active].astype(np.int32).tolist(),
+                    self.pos[active, 0].astype(np.int32).tolist(),
+                    self.pos[active, 1].astype(np.int32).tolist(),
+                )
+            ],
+            False,
+        )
+
+
 # -------------------------
 # Wall Class
 # -------------------------
@@ -704,6 +1181,7 @@ class Wall(pygame.sprite.Sprite):
     """
 
     texture = None  # Shared texture among all wall instances
+    tile_cache: Dict[Tuple[int, int], pygame.Surface] = {}  # Tiled images by size
 
     @classmethod
     def load_texture(cls) -> None:
@@ -711,21 +1189,38 @@ class Wall(pygame.sprite.Sprite):
         if cls.texture is None:
             cls.texture = pygame.image.load("graphics/walls/rock2.png").convert()
 
+    @classmethod
+    def get_tiled_image(cls, width: int, height: int) -> pygame.Surface:
+        """
+        Return a surface of the given size tiled with the wall texture.
+        The surface is built once per size and shared by all walls of that size.
+        """
+        image: pygame.Surface = cls.tile_cache.get((width, height))
+        if image is None:
+            cls.load_texture()  # Ensure texture is loaded once
+            # Create a surface with transparency for the wall
+            image = pygame.Surface((width, height), pygame.SRCALPHA)
+
+            # Tile the texture over the entire surface in a single batched blit
+            tex_width, tex_height = cls.texture.get_size()
+            image.blits(
+                [
+                    (cls.texture, (i, j))
+                    for i in range(0, width, tex_width)
+                    for j in range(0, height, tex_height)
+                ],
+                False,
+            )
+            cls.tile_cache[(width, height)] = image
+        return image
+
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         """
         Initialize a wall at position (x, y) with specified width and height.
         """
         super().__init__()
-        Wall.load_texture()  # Ensure texture is loaded once
-        # Create a surface with transparency for the wall
-        self.image: pygame.Surface = pygame.Surface((width, height), pygame.SRCALPHA)
-
-        # Tile the texture over the entire surface
-        tex_width, tex_height = Wall.texture.get_size()
-        for i in range(0, width, tex_width):
-            for j in range(0, height, tex_height):
-                self.image.blit(Wall.texture, (i, j))
-
+        # Walls of the same size share one tiled surface
+        self.image: pygame.Surface = Wall.get_tiled_image(width, height)
         self.rect: pygame.Rect = self.image.get_rect(topleft=(x, y))
 
 
@@ -741,15 +1236,34 @@ class Room:
     POINTS: int = 10  # Points awarded when completing the room
     reached_level: int = 0  # Tracks the current level
     outer_walls: pygame.sprite.Group = None  # Outer walls shared among all rooms
+    outer_xyxy: np.ndarray = None  # (x1, y1, x2, y2) boxes of the outer walls
+    # Bulk random draws for rooms and enemies, seeded from random (see seed_rng)
+    rng: np.random.Generator = np.random.default_rng(random.getrandbits(64))
     WALL_VARIATION_RANGE = 3
     ENEMY_SPAWN_SAFE_MULTIPLIER = 2
+    ENEMY_SPAWN_SAFE_SIZE = ENEMY_SPAWN_SAFE_MULTIPLIER * ENEMY_SPAWN_SAFE_MULTIPLIER
     BOSS_ROOM_ENEMY_COUNT = 1
     DEFAULT_ROOM_LEVEL = 0
+    PLACEMENT_BATCH_SIZE = 256  # Random wall or enemy candidates drawn at once
+    wall_candidates: List[List[int]] = []  # Unused random wall candidates
+    spawn_positions: List[List[int]] = []  # Unused random enemy spawn positions
+    # Wall and enemy safe zones by safe zone range
+    safe_zones: Dict[int, Tuple[pygame.Rect, pygame.Rect]] = {}
 
     # Wall placement constants based on TILE_SIZE
     INNER_WALL_MARGIN = Constants.INNER_WALL_MARGIN
     INNER_WALL_MULTIPLIER = Constants.INNER_WALL_MULTIPLIER
 
+    @staticmethod
+    def seed_rng() -> None:
+        """
+        Reseed the NumPy generator from the random module and drop the unused candidates,
+        so random.seed alone still reproduces room layouts and enemy movement.
+        """
+        Room.rng = np.random.default_rng(random.getrandbits(64))
+        Room.wall_candidates = []
+        Room.spawn_positions = []
+
     @staticmethod
     def set_reached_level(number: int) -> None:
         """Set the reached level to a specific number."""
@@ -771,10 +1285,17 @@ class Room:
         and generating inner walls and enemy placements.
         """
         self.game = game
-        self.walls: pygame.sprite.Group = pygame.sprite.Group()
-        self.enemies: pygame.sprite.Group = pygame.sprite.Group()
+        # Walls of this room
+        self.inner_walls: pygame.sprite.Group = pygame.sprite.Group()
+        self.enemies: EnemySoA = EnemySoA()
         self.NUMBER_OF_WALLS: int = 3  # Base count for inner walls
         self.NUMBER_OF_ENEMIES_BASE: int = 1  # Base count for enemies
+        # Possible inner wall widths and heights
+        self.wall_sizes: Tuple[int, int, int] = (
+            game.TILE_SIZE,
+            game.TILE_SIZE * 2,
+            game.TILE_SIZE * 3,
+        )
 
         # Create outer walls once and add them to the room
         if Room.outer_walls is None:
@@ -787,25 +1308,142 @@ class Room:
             Room.outer_walls.add(
                 Wall(game.WIDTH - game.TILE_SIZE, 0, game.TILE_SIZE, game.HEIGHT)
             )  # Right wall
-
-        self.walls.add(Room.outer_walls)
+            Room.outer_xyxy = Room.walls_xyxy(Room.outer_walls)
+
+        # Outer walls stay out of the room's own group but still block placements.
+        # The wall boxes, rects and collision grid start with the shared outer walls
+        # and each inner wall is added to them as it is placed.
+        self.wall_xyxy: np.ndarray = Room.outer_xyxy
+        self.wall_rects: List[pygame.Rect] = []
+        # Uniform grid with TILE_SIZE cells mapping each cell to the wall indices covering it
+        self.wall_grid: Dict[Tuple[int, int], List[int]] = {}
+        for wall in Room.outer_walls:
+            self.register_wall(wall)
 
         # Generate inner walls and spawn enemies
         self.create_room(save_zone_range)
 
+    @staticmethod
+    def walls_xyxy(walls: Iterable[Wall]) -> np.ndarray:
+        """Return an int32 (N, 4) array with the (x1, y1, x2, y2) box of every wall."""
+        return np.array(
+            [
+                [wall.rect.left, wall.rect.top, wall.rect.right, wall.rect.bottom]
+                for wall in walls
+            ],
+            np.int32,
+        ).reshape(-1, 4)
+
+    def register_wall(self, wall: Wall) -> None:
+        """
+        Add a wall's rect to the placement list and the collision grid.
+        Its grid index is its position in wall_rects and wall_xyxy.
+        """
+        for cell in self._cells(wall.rect):
+            self.wall_grid.setdefault(cell, []).append(len(self.wall_rects))
+        self.wall_rects.append(wall.rect)
+
+    def add_wall(self, wall: Wall) -> None:
+        """Add an inner wall to the room and record its box and rect."""
+        self.inner_walls.add(wall)
+        self.wall_xyxy = np.concatenate((self.wall_xyxy, Room.walls_xyxy([wall])))
+        self.register_wall(wall)
+
+    def collides_with_walls(self, rect: pygame.Rect) -> bool:
+        """
+        Return True if the rectangle overlaps any wall of the room.
+        pygame runs the whole scan over the wall list in C.
+        """
+        return rect.collidelist(self.wall_rects) != -1
+
+    def _cells(self, rect: pygame.Rect):
+        """Yield the (column, row) grid cells covered by the given rectangle."""
+        tile_size: int = self.game.TILE_SIZE
+        for col in range(rect.left // tile_size, (rect.right - 1) // tile_size + 1):
+            for row in range(rect.top // tile_size, (rect.bottom - 1) // tile_size + 1):
+                yield col, row
+
+    def broadphase(self, rect: pygame.Rect) -> np.ndarray:
+        """
+        Return the indices into wall_xyxy of the walls in the grid cells overlapped
+        by the rectangle. These are collision candidates only; callers still test
+        the exact overlap.
+        """
+        candidates: Dict[int, None] = {}
+        for cell in self._cells(rect):
+            for i in self.wall_grid.get(cell, ()):
+                candidates[i] = None
+        return np.fromiter(candidates, np.intp, len(candidates))
+
+    def get_safe_zones(self, save_zone_range: int) -> Tuple[pygame.Rect, pygame.Rect]:
+        """
+        Return the central safe zone kept free of walls and the extended safe zone
+        kept free of enemies. Both rects are computed once per safe zone range.
+        """
+        zones: Tuple[pygame.Rect, pygame.Rect] = Room.safe_zones.get(save_zone_range)
+        if zones is None:
+            spawn_range: int = save_zone_range * Room.ENEMY_SPAWN_SAFE_MULTIPLIER
+            zones = (
+                pygame.Rect(
+                    self.game.WIDTH // 2 - save_zone_range,
+                    self.game.HEIGHT // 2 - save_zone_range,
+                    save_zone_range * 2,
+                    save_zone_range * 2,
+                ),
+                pygame.Rect(
+                    self.game.WIDTH // 2 - spawn_range,
+                    self.game.HEIGHT // 2 - spawn_range,
+                    save_zone_range * Room.ENEMY_SPAWN_SAFE_SIZE,
+                    save_zone_range * Room.ENEMY_SPAWN_SAFE_SIZE,
+                ),
+            )
+            Room.safe_zones[save_zone_range] = zones
+        return zones
+
+    def next_wall_candidate(self) -> List[int]:
+        """
+        Return a random inner wall candidate as [x, y, width, height]. Candidates are
+        drawn from the NumPy generator in batches shared by all rooms.
+        """
+        if not Room.wall_candidates:
+            last_size: int = len(self.wall_sizes) - 1
+            candidates: np.ndarray = Room.rng.integers(
+                (self.game.wall_x_range[0], self.game.wall_y_range[0], 0, 0),
+                (
+                    self.game.wall_x_range[1],
+                    self.game.wall_y_range[1],
+                    last_size,
+                    last_size,
+                ),
+                (Room.PLACEMENT_BATCH_SIZE, 4),
+                endpoint=True,
+            )
+            candidates[:, 2:] = np.array(self.wall_sizes)[candidates[:, 2:]]
+            Room.wall_candidates = candidates.tolist()
+        return Room.wall_candidates.pop()
+
+    def next_spawn_position(self) -> List[int]:
+        """
+        Return a random enemy spawn position as [x, y]. Positions are drawn from
+        the NumPy generator in batches shared by all rooms.
+        """
+        if not Room.spawn_positions:
+            Room.spawn_positions = Room.rng.integers(
+                (self.game.enemy_x_range[0], self.game.enemy_y_range[0]),
+                (self.game.enemy_x_range[1], self.game.enemy_y_range[1]),
+                (Room.PLACEMENT_BATCH_SIZE, 2),
+                endpoint=True,
+            ).tolist()
+        return Room.spawn_positions.pop()
+
     def create_room(self, save_zone_range: int) -> None:
         """
         Create a room layout with inner walls and enemies.
         Walls are placed avoiding a safe zone in the center.
         Enemies are spawned outside an extended safe zone.
         """
-        # Define safe zone for walls in the center
-        safe_zone: pygame.Rect = pygame.Rect(
-            self.game.WIDTH // 2 - save_zone_range,
-            self.game.HEIGHT // 2 - save_zone_range,
-            save_zone_range * 2,
-            save_zone_range * 2,
-        )
+        # Safe zone for walls in the center and extended safe zone for enemy spawning
+        safe_zone, enemy_safe_zone = self.get_safe_zones(save_zone_range)
 
         # Place random inner walls avoiding the safe zone
         walls_random: int = random.randint(
@@ -814,46 +1452,14 @@ class Room:
         for _ in range(walls_random):
             valid_wall: bool = False
             while not valid_wall:
-                x: int = random.randint(
-                    self.game.TILE_SIZE * Room.INNER_WALL_MARGIN,
-                    self.game.WIDTH - self.game.TILE_SIZE * Room.INNER_WALL_MULTIPLIER,
-                )
-                y: int = random.randint(
-                    self.game.TILE_SIZE * Room.INNER_WALL_MARGIN,
-                    self.game.HEIGHT - self.game.TILE_SIZE * Room.INNER_WALL_MULTIPLIER,
-                )
-                width: int = random.choice(
-                    [
-                        self.game.TILE_SIZE,
-                        self.game.TILE_SIZE * 2,
-                        self.game.TILE_SIZE * 3,
-                    ]
-                )
-                height: int = random.choice(
-                    [
-                        self.game.TILE_SIZE,
-                        self.game.TILE_SIZE * 2,
-                        self.game.TILE_SIZE * 3,
-                    ]
-                )
+                x, y, width, height = self.next_wall_candidate()
                 candidate_rect: pygame.Rect = pygame.Rect(x, y, width, height)
-                if not candidate_rect.colliderect(safe_zone) and not any(
-                    candidate_rect.colliderect(wall.rect) for wall in self.walls
+                if not (
+                    candidate_rect.colliderect(safe_zone)
+                    or self.collides_with_walls(candidate_rect)
                 ):
                     valid_wall = True
-                    self.walls.add(Wall(x, y, width, height))
-
-        # Define extended safe zone for enemy spawning
-        enemy_safe_zone: pygame.Rect = pygame.Rect(
-            self.game.WIDTH // 2 - save_zone_range * Room.ENEMY_SPAWN_SAFE_MULTIPLIER,
-            self.game.HEIGHT // 2 - save_zone_range * Room.ENEMY_SPAWN_SAFE_MULTIPLIER,
-            save_zone_range
-            * Room.ENEMY_SPAWN_SAFE_MULTIPLIER
-            * Room.ENEMY_SPAWN_SAFE_MULTIPLIER,
-            save_zone_range
-            * Room.ENEMY_SPAWN_SAFE_MULTIPLIER
-            * Room.ENEMY_SPAWN_SAFE_MULTIPLIER,
-        )
+                    self.add_wall(Wall(x, y, width, height))
 
         boss: bool = False
         boss_spawned: bool = False
@@ -869,35 +1475,25 @@ class Room:
             boss = True
             enemies_random = self.BOSS_ROOM_ENEMY_COUNT
 
-        # Spawn enemies ensuring they do not fall in the safe zone or collide with walls
+        # Spawn enemies ensuring they do not fall in the safe zone or collide with walls.
+        # Candidate positions are checked with a rect of the enemy's size, so an enemy
+        # is only created once a free position has been found.
+        enemy_type: type = BossEnemy if boss else Enemy
+        enemy_type.load_frames()
+        enemy_rect: pygame.Rect = enemy_type.FRAMES[0].get_rect()
         for _ in range(enemies_random):
             if boss_spawned:
                 break
             valid_position: bool = False
             while not valid_position:
-                x: int = random.randint(
-                    self.game.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
-                    self.game.WIDTH
-                    - self.game.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
-                )
-                y: int = random.randint(
-                    self.game.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
-                    self.game.HEIGHT
-                    - self.game.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
-                )
-                # Create temporary enemy for collision checking
-                if boss:
-                    temp_enemy = BossEnemy(x, y, self.game)
-                    boss_spawned = True
-                else:
-                    temp_enemy = Enemy(x, y, self.game)
-
-                enemy_rect: pygame.Rect = temp_enemy.rect
-                if not enemy_rect.colliderect(enemy_safe_zone) and not any(
-                    enemy_rect.colliderect(wall.rect) for wall in self.walls
+                enemy_rect.center = self.next_spawn_position()
+                if not (
+                    enemy_rect.colliderect(enemy_safe_zone)
+                    or self.collides_with_walls(enemy_rect)
                 ):
                     valid_position = True
-                    self.enemies.add(temp_enemy)
+                    self.enemies.add(enemy_type(*enemy_rect.center, self.game))
+                    boss_spawned = boss
 
 
 # -------------------------
@@ -920,6 +1516,49 @@ class Upgrade(pygame.Rect):
     NUMBER_OFFSET_Y = 140
     UPGRADE_PANEL_Y = 85
 
+    # Border surfaces by (width, height, thickness)
+    border_cache: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+    @classmethod
+    def get_border_image(
+        cls, width: int, height: int, border_thickness: int
+    ) -> pygame.Surface:
+        """
+        Return a transparent surface of the given size with a textured border.
+        The surface is built once per size and thickness and reused on every draw.
+        """
+        key: Tuple[int, int, int] = (width, height, border_thickness)
+        upgrade_surface: pygame.Surface = cls.border_cache.get(key)
+        if upgrade_surface is None:
+            # The texture is read from disk only once by the cached loader
+            border_texture: pygame.Surface = load_image("graphics/walls/rock2.png")
+
+            # Create a transparent surface for drawing the upgrade border
+            # (new SRCALPHA surfaces start fully transparent)
+            upgrade_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+
+            # Create horizontal and vertical borders by scaling the texture
+            border_width, border_height = border_texture.get_size()
+            horizontal_border: pygame.Surface = pygame.transform.scale(
+                border_texture, (border_width, border_thickness)
+            )
+            vertical_border: pygame.Surface = pygame.transform.scale(
+                border_texture, (border_thickness, border_height)
+            )
+
+            # Tile horizontal borders along the top and bottom edges
+            for x in range(0, width, border_width):
+                upgrade_surface.blit(horizontal_border, (x, 0))
+                upgrade_surface.blit(horizontal_border, (x, height - border_thickness))
+
+            # Tile vertical borders along the left and right edges
+            for y in range(0, height, border_height):
+                upgrade_surface.blit(vertical_border, (0, y))
+                upgrade_surface.blit(vertical_border, (width - border_thickness, y))
+
+            cls.border_cache[key] = upgrade_surface
+        return upgrade_surface
+
     def __init__(
         self,
         screen: pygame.Surface,
@@ -930,6 +1569,7 @@ class Upgrade(pygame.Rect):
     ) -> None:
         """
         Initialize the upgrade rectangle with fixed position, size, and assigned function.
+        The image and texts never change, so they are prepared here once instead of in draw.
         """
         super().__init__(
             self.UI_SPACING + number * (self.UPGRADE_WIDTH + self.UI_SPACING),
@@ -942,52 +1582,6 @@ class Upgrade(pygame.Rect):
         self.function_name = function_name
         self.function_number = function_number
 
-    def activate(self) -> None:
-        """
-        Activate the upgrade by invoking the associated player method with the specified upgrade value.
-        """
-        method = getattr(self.player, self.function_name)
-        method(self.function_number)
-
-    def draw(self) -> None:
-        """
-        Draw the upgrade rectangle, its border, an image representing the upgrade, and text showing the function name and value.
-        """
-        # Create a transparent surface for drawing the upgrade border
-        border_thickness: int = Upgrade.BORDER_THICKNESS
-        upgrade_surface: pygame.Surface = pygame.Surface(
-            (self.width, self.height), pygame.SRCALPHA
-        )
-        upgrade_surface.fill((0, 0, 0, 0))  # Transparent background
-
-        # Load the texture for the border
-        border_image_original: pygame.Surface = pygame.image.load(
-            "graphics/walls/rock2.png"
-        ).convert_alpha()
-
-        # Create horizontal and vertical borders by scaling the texture
-        border_width: int = border_image_original.get_width()
-        horizontal_border: pygame.Surface = pygame.transform.scale(
-            border_image_original, (border_width, border_thickness)
-        )
-        border_height: int = border_image_original.get_height()
-        vertical_border: pygame.Surface = pygame.transform.scale(
-            border_image_original, (border_thickness, border_height)
-        )
-
-        # Tile horizontal borders along the top and bottom edges
-        for x in range(0, self.width, horizontal_border.get_width()):
-            upgrade_surface.blit(horizontal_border, (x, 0))
-            upgrade_surface.blit(horizontal_border, (x, self.height - border_thickness))
-
-        # Tile vertical borders along the left and right edges
-        for y in range(0, self.height, vertical_border.get_height()):
-            upgrade_surface.blit(vertical_border, (0, y))
-            upgrade_surface.blit(vertical_border, (self.width - border_thickness, y))
-
-        # Blit the upgrade surface onto the main screen at the upgrade rectangle's position
-        self.screen.blit(upgrade_surface, (self.left, self.top))
-
         # Choose upgrade image based on the function name using pattern matching
         match self.function_name:
             case "increase_damage":
@@ -1004,44 +1598,73 @@ class Upgrade(pygame.Rect):
                 image_path = "graphics/bullets/bullet.png"
 
         # Load, scale, and position the upgrade image
-        image: pygame.Surface = pygame.image.load(image_path).convert_alpha()
-        image = pygame.transform.rotozoom(image, 0, Upgrade.UPGRADE_IMAGE_SCALE)
-        image_rect: pygame.Rect = image.get_rect(
+        self.image: pygame.Surface = load_rotozoomed(
+            image_path, Upgrade.UPGRADE_IMAGE_SCALE
+        )
+        self.image_rect: pygame.Rect = self.image.get_rect(
             center=(self.centerx, self.centery - Upgrade.IMAGE_OFFSET_Y)
         )
-        self.screen.blit(image, image_rect)
 
         # Render and position the upgrade function name text
         text_to_render: str = self.function_name.replace("_", " ")
         padding: int = 10
         available_width: int = self.width - 2 * padding
-        font_size: int = 50
-        font: pygame.font.Font = pygame.font.Font(None, font_size)
-        text_width, _ = font.size(text_to_render)
-        while text_width > available_width and font_size > 10:
-            font_size -= 1
-            font = pygame.font.Font(None, font_size)
-            text_width, _ = font.size(text_to_render)
-        text_surface: pygame.Surface = font.render(
+        # Binary search for the largest font size (10 to 50) at which the text fits
+        min_font_size: int = 10
+        max_font_size: int = 50
+        while min_font_size < max_font_size:
+            font_size: int = (min_font_size + max_font_size + 1) // 2
+            text_width, _ = get_font(font_size).size(text_to_render)
+            if text_width <= available_width:
+                min_font_size = font_size
+            else:
+                max_font_size = font_size - 1
+        font: pygame.font.Font = get_font(min_font_size)
+        self.text_surface: pygame.Surface = font.render(
             text_to_render, True, (255, 255, 255)
         )
-        text_rect: pygame.Rect = text_surface.get_rect(
+        self.text_rect: pygame.Rect = self.text_surface.get_rect(
             center=(self.centerx, self.centery + Upgrade.TEXT_OFFSET_Y)
         )
-        self.screen.blit(text_surface, text_rect)
 
         # Render and position the upgrade value (number)
-        font = pygame.font.Font(None, Upgrade.NUMBER_FONT_SIZE)
-        number_out: pygame.Surface = font.render(
+        font = get_font(Upgrade.NUMBER_FONT_SIZE)
+        self.number_out: pygame.Surface = font.render(
             f"{self.function_number}", True, (255, 255, 255)
         )
-        number_out_rect: pygame.Rect = number_out.get_rect(
+        self.number_out_rect: pygame.Rect = self.number_out.get_rect(
             center=(
                 self.centerx,
-                self.centery + Upgrade.NUMBER_OFFSET_Y + text_rect.height,
+                self.centery + Upgrade.NUMBER_OFFSET_Y + self.text_rect.height,
             )
         )
-        self.screen.blit(number_out, number_out_rect)
+
+    def activate(self) -> None:
+        """
+        Activate the upgrade by invoking the associated player method with the specified upgrade value.
+        """
+        method = getattr(self.player, self.function_name)
+        method(self.function_number)
+
+    def draw(self) -> None:
+        """
+        Draw the upgrade rectangle, its border, an image representing the upgrade, and text showing the function name and value.
+        """
+        # Blit the cached border, image and texts in a single batched call
+        self.screen.blits(
+            [
+                (
+                    Upgrade.get_border_image(
+                        self.width, self.height, Upgrade.BORDER_THICKNESS
+                    ),
+                    (self.left, self.top),
+                ),
+                (self.image, self.image_rect),
+                (self.text_surface, self.text_rect),
+                (self.number_out, self.number_out_rect),
+            ],
+            False,
+        )
 
 
 # -------------------------
@@ -1071,6 +1694,7 @@ class Game:
     UPGRADE_DRAW_DELAY_MS = 500
     HEART_SPACING_STEP = 25
     PLAYER_SCALE_FACTOR = 1.5
+    BANNER_POS: tuple = (5, 5)
 
     # Color definitions
     WHITE: tuple = (255, 255, 255)
@@ -1090,6 +1714,23 @@ class Game:
         self.HEIGHT: int = Constants.GAME_HEIGHT
         self.FPS: int = Constants.GAME_FPS
         self.TILE_SIZE: int = Constants.GAME_TILE_SIZE
+        # Inclusive (min, max) coordinates for random inner walls and enemy spawns
+        self.wall_x_range: Tuple[int, int] = (
+            self.TILE_SIZE * Room.INNER_WALL_MARGIN,
+            self.WIDTH - self.TILE_SIZE * Room.INNER_WALL_MULTIPLIER,
+        )
+        self.wall_y_range: Tuple[int, int] = (
+            self.TILE_SIZE * Room.INNER_WALL_MARGIN,
+            self.HEIGHT - self.TILE_SIZE * Room.INNER_WALL_MULTIPLIER,
+        )
+        self.enemy_x_range: Tuple[int, int] = (
+            self.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
+            self.WIDTH - self.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
+        )
+        self.enemy_y_range: Tuple[int, int] = (
+            self.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
+            self.HEIGHT - self.TILE_SIZE * Constants.ENEMY_SPAWN_MARGIN,
+        )
         self.can_upgrade: bool = False
         self.difficulty: int = 0
         self.save_zone_range: int = Game.DEFAULT_SAVE_ZONE_RANGE
@@ -1107,20 +1748,33 @@ class Game:
         self.background_image = pygame.transform.rotozoom(self.background_image, 0, 0.2)
 
         # Load and scale the health banner image
-        self.hp_banner: pygame.Surface = pygame.image.load(
-            "graphics/background/banner.png"
-        ).convert_alpha()
-        self.hp_banner = pygame.transform.scale(self.hp_banner, (800, 50))
+        self.hp_banner: pygame.Surface = load_scaled(
+            "graphics/background/banner.png", 800, 50
+        )
 
         # Load, scale, and store heart images for health display
-        self.heart_full: pygame.Surface = pygame.image.load(
-            "graphics/player/goat1.png"
-        ).convert_alpha()
-        self.heart_empty: pygame.Surface = pygame.image.load(
-            "graphics/player/goat2.png"
-        ).convert_alpha()
-        self.heart_full = pygame.transform.scale(self.heart_full, (40, 40))
-        self.heart_empty = pygame.transform.scale(self.heart_empty, (40, 40))
+        self.heart_full: pygame.Surface = load_scaled(
+            "graphics/player/goat1.png", 40, 40
+        )
+        self.heart_empty: pygame.Surface = load_scaled(
+            "graphics/player/goat2.png", 40, 40
+        )
+        # Health banner and hearts overlay for the last drawn (full, empty) heart counts
+        self.hud_key: Tuple[int, int] = None
+        self.hud_image: pygame.Surface = None
+
+        # The static parts of the welcome and death screens are rendered only once
+        self.welcome_overlay: pygame.Surface = self.build_welcome_overlay()
+        self.death_overlay, self.death_score_y = self.build_death_overlay()
+
+        # Load and scale animation frames once, so spawning does not touch the disk
+        Player.load_frames()
+        Enemy.load_frames()
+        BossEnemy.load_frames()
+
+        # Compile the Numba kernels while loading instead of on the first gameplay frame
+        if njit is not None:
+            warm_up_kernels()
 
         self.save_zone_range = Constants.DEFAULT_SAVE_ZONE_RANGE
         bg_music = pygame.mixer.Sound("audio/background_music.mp3")
@@ -1135,6 +1789,7 @@ class Game:
         Bullet.set_bullet_speed(Bullet.DEFAULT_BULLET_SPEED)
         Enemy.set_speed(self.INITIAL_ENEMY_SPEED)
         Room.set_reached_level(Room.DEFAULT_ROOM_LEVEL)
+        Room.seed_rng()
         Enemy.set_max_health(self.INITIAL_ENEMY_HEALTH)
         Enemy.set_damage(Enemy.DEFAULT_DAMAGE)
         Player.set_damaged_sound()
@@ -1147,42 +1802,36 @@ class Game:
         self.player.set_speed(3)
 
         # Initialize groups for bullets, room elements, and all sprites
-        self.bullets: pygame.sprite.Group = pygame.sprite.Group()
+        self.bullets: BulletPool = BulletPool(self)
         self.room: Room = Room(self.save_zone_range, self)
         self.all_sprites: pygame.sprite.Group = pygame.sprite.Group()
         self.all_sprites.add(self.player)
-        self.all_sprites.add(self.room.walls)
-        self.all_sprites.add(self.room.enemies)
+        self.all_sprites.add(Room.outer_walls, self.room.inner_walls)
 
-    def welcome_screen(self) -> None:
+    def build_welcome_overlay(self) -> pygame.Surface:
         """
-        Display the welcome screen with a title, background, and prompt to begin the game.
+        Build the transparent overlay with the welcome title, player image and prompt.
         """
-        welcome_font: pygame.font.Font = pygame.font.Font(None, 100)
-        self.screen.blit(
-            self.background_image,
-            (Constants.BACKGROUND_X_OFFSET, Constants.BACKGROUND_Y_OFFSET),
+        overlay: pygame.Surface = pygame.Surface(
+            (self.WIDTH, self.HEIGHT), pygame.SRCALPHA
         )
-
+        welcome_font: pygame.font.Font = get_font(100)
         text: pygame.Surface = welcome_font.render("WELCOME", True, self.WHITE)
         text_rect: pygame.Rect = text.get_rect(
             center=(self.WIDTH // 2, Game.WELCOME_TEXT_Y_OFFSET)
         )
-        self.screen.blit(text, text_rect)
+        overlay.blit(text, text_rect)
 
         # Display a static player image on the welcome screen
-        player_stand: pygame.Surface = pygame.image.load(
-            "graphics/player/player_walk_2.png"
-        ).convert_alpha()
-        player_stand = pygame.transform.rotozoom(
-            player_stand, 0, Game.PLAYER_SCALE_FACTOR
+        player_stand: pygame.Surface = load_rotozoomed(
+            "graphics/player/player_walk_2.png", Game.PLAYER_SCALE_FACTOR
         )
         player_stand_rect: pygame.Rect = player_stand.get_rect(
             center=(self.WIDTH // 2, self.HEIGHT // 2 - Game.WELCOME_PLAYER_OFFSET_Y)
         )
-        self.screen.blit(player_stand, player_stand_rect)
+        overlay.blit(player_stand, player_stand_rect)
 
-        welcome_font = pygame.font.Font(None, 90)
+        welcome_font = get_font(90)
         prompt: pygame.Surface = welcome_font.render(
             "Press SPACE to begin", True, self.WHITE
         )
@@ -1192,49 +1841,67 @@ class Game:
                 self.HEIGHT // 2 + Constants.WELCOME_PROMPT_Y_OFFSET,
             )
         )
-        self.screen.blit(prompt, prompt_rect)
-
-        pygame.display.update()
+        overlay.blit(prompt, prompt_rect)
+        return overlay
 
-    def death_screen(self, player: Player) -> None:
+    def build_death_overlay(self) -> Tuple[pygame.Surface, int]:
         """
-        Display the death screen with the player's final score and a prompt to restart.
+        Build the transparent overlay with the death title and restart prompt.
+        Also return the vertical center of the score line drawn between them.
         """
-        death_font: pygame.font.Font = pygame.font.Font(None, 100)
-        self.screen.blit(
-            self.background_image,
-            (Constants.BACKGROUND_X_OFFSET, Constants.BACKGROUND_Y_OFFSET),
+        overlay: pygame.Surface = pygame.Surface(
+            (self.WIDTH, self.HEIGHT), pygame.SRCALPHA
         )
-
+        death_font: pygame.font.Font = get_font(100)
         text: pygame.Surface = death_font.render("YOU DIED", True, self.WHITE)
         text_rect: pygame.Rect = text.get_rect(
             center=(self.WIDTH // 2, self.HEIGHT // 2 - Game.DEATH_TEXT_OFFSET_Y)
         )
-        self.screen.blit(text, text_rect)
+        overlay.blit(text, text_rect)
+        score_y: int = self.HEIGHT // 2 - Game.SCORE_TEXT_Y_OFFSET + text_rect.height
 
-        score: pygame.Surface = death_font.render(
-            f"SCORE: {player.get_points()}", True, self.WHITE
-        )
-        score_rect: pygame.Rect = score.get_rect(
-            center=(
-                self.WIDTH // 2,
-                self.HEIGHT // 2 - Game.SCORE_TEXT_Y_OFFSET + text_rect.height,
-            )
-        )
-        self.screen.blit(score, score_rect)
-
-        death_font = pygame.font.Font(None, 90)
+        death_font = get_font(90)
         prompt: pygame.Surface = death_font.render("Press SPACE to", True, self.WHITE)
         prompt_rect: pygame.Rect = prompt.get_rect(
             center=(self.WIDTH // 2, self.HEIGHT // 2 + 50)
         )
-        self.screen.blit(prompt, prompt_rect)
+        overlay.blit(prompt, prompt_rect)
 
         prompt2: pygame.Surface = death_font.render("PLAY AGAIN", True, self.WHITE)
         prompt_rect2: pygame.Rect = prompt2.get_rect(
             center=(self.WIDTH // 2, self.HEIGHT // 2 + 55 + prompt_rect.height)
         )
-        self.screen.blit(prompt2, prompt_rect2)
+        overlay.blit(prompt2, prompt_rect2)
+        return overlay, score_y
+
+    def welcome_screen(self) -> None:
+        """
+        Display the welcome screen with a title, background, and prompt to begin the game.
+        """
+        self.screen.blit(
+            self.background_image,
+            (Constants.BACKGROUND_X_OFFSET, Constants.BACKGROUND_Y_OFFSET),
+        )
+        self.screen.blit(self.welcome_overlay, (0, 0))
+        pygame.display.update()
+
+    def death_screen(self, player: Player) -> None:
+        """
+        Display the death screen with the player's final score and a prompt to restart.
+        """
+        self.screen.blit(
+            self.background_image,
+            (Constants.BACKGROUND_X_OFFSET, Constants.BACKGROUND_Y_OFFSET),
+        )
+        self.screen.blit(self.death_overlay, (0, 0))
+
+        score: pygame.Surface = get_font(100).render(
+            f"SCORE: {player.get_points()}", True, self.WHITE
+        )
+        score_rect: pygame.Rect = score.get_rect(
+            center=(self.WIDTH // 2, self.death_score_y)
+        )
+        self.screen.blit(score, score_rect)
 
         pygame.display.update()
 
@@ -1262,7 +1929,8 @@ class Game:
         and triggering an upgrade if the level meets the criteria.
         """
         # Adjust enemy stats for level progression
-        if Room.get_reached_level() % Game.LEVEL_INTERVAL_FOR_ENEMY_STATS:
+        level: int = Room.get_reached_level()
+        if level % Game.LEVEL_INTERVAL_FOR_ENEMY_STATS:
             Enemy.increase_max_health(self.ENEMY_HEALTH_INCREASE)
             if Enemy.get_speed() < 5:
                 Enemy.increase_speed(self.ENEMY_SPEED_LARGE_INC)
@@ -1271,18 +1939,19 @@ class Game:
             Enemy.increase_damage(self.ENEMY_DAMAGE_INCREASE)
 
         Room.increase_reached_level(1)
+        level += 1
         self.player.add_points(Room.POINTS)
+        # The player and the shared outer walls stay in all_sprites, only the inner
+        # walls of the previous room are swapped for the new ones
+        self.all_sprites.remove(self.room.inner_walls)
         self.room = Room(self.save_zone_range, self)
-        self.all_sprites.empty()
+        self.all_sprites.add(self.room.inner_walls)
         self.bullets.empty()
-        self.all_sprites.add(self.player)
-        self.all_sprites.add(self.room.walls)
-        self.all_sprites.add(self.room.enemies)
         self.player.resetLocation()
         self.player.immunity_timer = 0
 
         # Check if upgrade option should be activated
-        if (Room.get_reached_level() + 1) % (self.difficulty + 1) == 0:
+        if (level + 1) % (self.difficulty + 1) == 0:
             self.can_upgrade = True
             pygame.display.flip()
             self.upgrade()
@@ -1309,6 +1978,7 @@ class Game:
             "increase_bullet_speed",
         ]
         upgrade_rects: List[Upgrade] = []
+        level: int = Room.get_reached_level()
         for i in range(3):
             chosen_function: str = random.choice(functions)
             functions.remove(chosen_function)
@@ -1316,69 +1986,111 @@ class Game:
             # Calculate upgrade value based on function and current level
             match chosen_function:
                 case "increase_damage":
-                    lower = max(1, int(Room.get_reached_level() / 2))
-                    upper = max(2, int(Room.get_reached_level() / 2))
+                    lower = max(1, int(level / 2))
+                    upper = max(2, int(level / 2))
                     number = self.balanced_randint(lower, upper)
                 case "increase_health":
-                    lower = max(1, int(Room.get_reached_level() / 2))
-                    upper = max(2, int(Room.get_reached_level() / 2))
+                    lower = max(1, int(level / 2))
+                    upper = max(2, int(level / 2))
                     number = self.balanced_randint(lower, upper)
                 case "heal":
-                    lower = max(2, int(Room.get_reached_level() / 2))
-                    upper = max(4, int(Room.get_reached_level()))
+                    lower = max(2, int(level / 2))
+                    upper = max(4, level)
                     number = self.balanced_randint(lower, upper)
                 case "decrease_shoot_cooldown":
-                    lower = max(1, int(Room.get_reached_level() / 2))
+                    lower = max(1, int(level / 2))
                     upper = lower
                     number = self.balanced_randint(lower, upper)
                 case "increase_speed":
-                    lower = max(1, int(Room.get_reached_level() / 2))
-                    upper = max(2, int(Room.get_reached_level()))
+                    lower = max(1, int(level / 2))
+                    upper = max(2, level)
                     number = self.balanced_randint(lower, upper)
                 case "increase_bullet_speed":
-                    lower = max(1, int(Room.get_reached_level() / 2))
-                    upper = max(2, int(Room.get_reached_level() / 3))
+                    lower = max(1, int(level / 2))
+                    upper = max(2, int(level / 3))
                     number = self.balanced_randint(lower, upper)
             upgrade_rects.append(
                 Upgrade(self.screen, i, self.player, chosen_function, number)
             )
         return upgrade_rects
 
-    def draw_upgrade_rects(self, upgrade_rects: List[Upgrade]) -> None:
+    def draw_upgrade_prompt(self) -> None:
         """
-        Display upgrade options on the screen with a prompt.
-        Each upgrade rectangle is drawn with a slight delay.
+        Display the prompt shown above the upgrade options.
         """
-        font: pygame.font.Font = pygame.font.Font(None, 75)
+        font: pygame.font.Font = get_font(75)
         prompt: pygame.Surface = font.render("Choose upgrade", True, self.WHITE)
         prompt_rect: pygame.Rect = prompt.get_rect(center=(self.WIDTH // 2, 35))
         self.screen.blit(prompt, prompt_rect)
-        pygame.display.update()
-
-        for upgrade_rect in upgrade_rects:
-            pygame.time.delay(Game.UPGRADE_DRAW_DELAY_MS)
-            upgrade_rect.draw()
-            pygame.display.update()
-
-        pygame.event.clear()
+        pygame.display.update(prompt_rect)
 
     def upgrade(self) -> None:
         """
         Present upgrade options to the player and wait for the player to select one.
+        Each upgrade rectangle is revealed with a slight delay without blocking,
+        so events keep being handled and revealed upgrades can be chosen right away.
         """
         upgrade_rects: List[Upgrade] = self.get_upgrade_rects()
-        self.draw_upgrade_rects(upgrade_rects)
+        self.draw_upgrade_prompt()
+        reveal_start: int = pygame.time.get_ticks()
+        revealed: int = 0
 
         while self.can_upgrade:
+            # Only the area of each newly drawn upgrade needs to reach the display
+            if (
+                revealed < len(upgrade_rects)
+                and pygame.time.get_ticks() - reveal_start
+                >= (revealed + 1) * Game.UPGRADE_DRAW_DELAY_MS
+            ):
+                upgrade_rects[revealed].draw()
+                pygame.display.update(upgrade_rects[revealed])
+                revealed += 1
+
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     Game.end_game()
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    for upgrade_rect in upgrade_rects:
+                    for upgrade_rect in upgrade_rects[:revealed]:
                         if upgrade_rect.collidepoint(event.pos):
                             upgrade_rect.activate()
                             self.can_upgrade = False
 
+            self.clock.tick(self.FPS)
+
+    def get_hud_image(self) -> pygame.Surface:
+        """
+        Return the HUD overlay with the health banner and the full and empty hearts,
+        positioned for blitting at the top-left corner of the screen.
+        The overlay is only rebuilt when the number of full or empty hearts changes.
+        """
+        full_hearts: int = int(self.player.current_health)
+        empty_hearts: int = int(self.player.max_health - self.player.current_health)
+        if self.hud_key != (full_hearts, empty_hearts):
+            self.hud_key = (full_hearts, empty_hearts)
+            spacing: float = Game.HEART_SPACING_FACTOR * Game.HEART_SPACING_STEP
+            banner_rect: pygame.Rect = self.hp_banner.get_rect(topleft=Game.BANNER_POS)
+            hearts_rect: pygame.Rect = self.heart_full.get_rect(
+                topleft=(Constants.HEART_INITIAL_X, Constants.HEART_Y)
+            )
+            hearts_rect.width += int((full_hearts + empty_hearts) * spacing)
+            self.hud_image = pygame.Surface(
+                banner_rect.union(hearts_rect).bottomright, pygame.SRCALPHA
+            )
+            self.hud_image.blit(self.hp_banner, banner_rect)
+            # The spacing is constant, so placing heart i at i * spacing gives the same
+            # positions as adding the spacing once per heart drawn
+            self.hud_image.blits(
+                [
+                    (
+                        self.heart_full if i < full_hearts else self.heart_empty,
+                        (hearts_rect.x + i * spacing, hearts_rect.y),
+                    )
+                    for i in range(full_hearts + empty_hearts)
+                ],
+                False,
+            )
+        return self.hud_image
+
     def run(self) -> None:
         """
         Main game loop:
@@ -1405,48 +2117,27 @@ class Game:
             )
 
             # Update game objects
-            self.player.update(self.room.walls)
-            self.bullets.update(self.room.walls, self.room.enemies, self.player)
-            self.room.enemies.update(self.player, self.room.walls)
+            self.player.update(self.room)
+            self.bullets.update(self.room, self.player)
+            self.room.enemies.update(self.player, self.room.wall_xyxy)
 
             # Check collision between player and enemies to apply damage
-            if pygame.sprite.spritecollide(self.player, self.room.enemies, False):
+            if pygame.sprite.spritecollideany(self.player, self.room.enemies):
                 self.player.take_damage()
 
             # Advance level if all enemies are defeated
             if len(self.room.enemies) == 0:
                 self.new_level()
 
-            # Draw sprites and bullets
-            self.all_sprites.draw(self.screen)
+            # Draw sprites, enemies and bullets, each with a single batched blit
+            self.screen.blits(
+                [(sprite.image, sprite.rect) for sprite in self.all_sprites], False
+            )
+            self.room.enemies.draw(self.screen)
             self.bullets.draw(self.screen)
 
             # Draw health banner and hearts (full and empty)
-            banner_pos: tuple = (5, 5)
-            self.screen.blit(self.hp_banner, banner_pos)
-
-            draw_position: float = 0
-            for i in range(int(self.player.current_health)):
-                self.screen.blit(
-                    self.heart_full,
-                    (
-                        Constants.HEART_INITIAL_X
-                        + draw_position * Game.HEART_SPACING_STEP,
-                        Constants.HEART_Y,
-                    ),
-                )
-                draw_position += Game.HEART_SPACING_FACTOR
-
-            for i in range(int(self.player.max_health - self.player.current_health)):
-                self.screen.blit(
-                    self.heart_empty,
-                    (
-                        Constants.HEART_INITIAL_X
-                        + draw_position * Game.HEART_SPACING_STEP,
-                        Constants.HEART_Y,
-                    ),
-                )
-                draw_position += Game.HEART_SPACING_FACTOR
+            self.screen.blit(self.get_hud_image(), (0, 0))
 
             # If player is immune, show blinking effect
             if self.player.is_immune: